@@ -23,7 +23,10 @@ __all__ = ["CONFIG_SCHEMA"]
 
 import yaml
 
-CONFIG_SCHEMA = yaml.safe_load(
+# Use the LibYAML-based loader if PyYAML was built with it.
+_SchemaLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CONFIG_SCHEMA = yaml.load(
     """
 $schema: http://json-schema.org/draft-07/schema#
 $id: https://github.com/lsst-ts/ts_lasertracker/blob/master/schema/alignment.yaml
@@ -172,5 +175,6 @@ properties:
 required:
   - instances
 additionalProperties: false
-"""
+""",
+    Loader=_SchemaLoader,
 )
@@ -36,10 +36,10 @@ from .config_schema import CONFIG_SCHEMA
 from .enums import ErrorCodes
 from .mock import MockT2SA
 from .t2sa_model import T2SAError, T2SAModel
-from .utils import Target
+from .utils import Offsets, Target
 
 # The following targets must appear in config.targets
-REQUIRED_TARGETS = {"CAM", "M1M3", "M2"}
+REQUIRED_TARGETS = frozenset({"CAM", "M1M3", "M2"})
 reg_exp_lsta_off = re.compile("(.*)LOFF")
 reg_exp_lsta_on = re.compile("(.*)LON")
 
@@ -121,6 +121,9 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
 
         self.timeout_std = 5.0
 
+        # Set of valid targets; set by configure.
+        self._targets: frozenset[str] = frozenset()
+
         self._run_telemetry_loop = False
         self.telemetry_loop_task: asyncio.Task = utils.make_done_future()
 
@@ -155,13 +158,23 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         t2sa_host = self.config.t2sa_host
         t2sa_port = self.config.t2sa_port
 
-        if self.simulation_mode == 2 and self._mock_t2sa is None:
-            self.log.debug("Running t2sa mock.")
-            self._mock_t2sa = MockT2SA(log=self.log)
-            await self._mock_t2sa.start_task
+        if self.simulation_mode == 2:
+            if self._mock_t2sa is None:
+                self.log.debug("Running t2sa mock.")
+                self._mock_t2sa = MockT2SA(log=self.log)
+                await self._mock_t2sa.start_task
             t2sa_host = self._mock_t2sa.host
             t2sa_port = self._mock_t2sa.port
 
+        if self.model is not None and (
+            self.model.host,
+            self.model.port,
+            self.model.read_timeout,
+        ) != (t2sa_host, t2sa_port, self.config.read_timeout):
+            self.log.info("T2SA connection parameters changed. Disconnecting.")
+            await self.model.disconnect()
+            self.model = None
+
         if self.model is None:
             self.log.info(
                 f"Connecting alignment model to: {t2sa_host}:{t2sa_port}, "
@@ -187,12 +200,11 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
                 self.log.exception(error_message)
                 raise RuntimeError(error_message)
             self.log.debug(
-                f"Connected to t2sa at {self.model.host}:{self.model.port}. "
-                "Setting telescope position."
+                "Connected to t2sa at %s:%s. Setting telescope position.",
+                self.model.host,
+                self.model.port,
             )
-        elif self.model is not None:
-            if self.model.connected:
-                await self.model.disconnect()
+        elif not self.model.connected:
             await self.model.connect()
 
     async def handle_summary_state(self) -> None:
@@ -256,14 +268,35 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
             )
 
         instance = types.SimpleNamespace(**instance_dicts[0])
-        missing_targets = REQUIRED_TARGETS - set(instance.targets)
+        targets = frozenset(instance.targets)
+        missing_targets = REQUIRED_TARGETS - targets
         if missing_targets:
             raise RuntimeError(
                 f"config.targets is missing required targets {sorted(missing_targets)}"
             )
         self.config = instance
+        self._targets = targets
         self.log.info(f"Configuration: {self.config}")
 
+    def assert_enabled_with_model(self) -> T2SAModel:
+        """Assert that the CSC is enabled and connected to the T2SA.
+
+        Returns
+        -------
+        model : `T2SAModel`
+            The T2SA model.
+
+        Raises
+        ------
+        salobj.ExpectedError
+            If the CSC is not enabled or the T2SA model is not defined.
+        """
+        self.assert_enabled()
+        model = self.model
+        if model is None:
+            raise salobj.ExpectedError("Not connected to the T2SA.")
+        return model
+
     @staticmethod
     def get_config_pkg() -> str:
         return "ts_config_mttcs"
@@ -276,28 +309,26 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_measureTarget.DataType``
             Command data.
         """
-        self.log.debug("measure Target")
-        self.assert_enabled()
-        assert self.model is not None
-        if data.target not in self.config.targets:
+        model = self.assert_enabled_with_model()
+        if data.target not in self._targets:
             raise salobj.ExpectedError(
                 f"Unknown target {data.target}; must one of {self.config.targets}"
             )
 
         await self.cmd_measureTarget.ack_in_progress(
             data,
-            timeout=self.model.read_timeout,
+            timeout=model.read_timeout,
             result=f"Measuring {data.target}.",
         )
 
         await self.set_telescope_position()
 
         self.log.info(f"Measuring target {data.target}.")
-        await self.model.measure_target(data.target)
+        await model.measure_target(data.target)
 
         await self.cmd_measureTarget.ack_in_progress(
             data,
-            timeout=self.model.read_timeout,
+            timeout=model.read_timeout,
             result="Get target position.",
         )
 
@@ -305,9 +336,17 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
 
         target_name = self.get_target_name(data.target)
 
-        last_measurement = await self.model.get_target_position(target_name)
+        last_measurement = await model.get_target_position(target_name)
 
-        await self.evt_positionPublish.set_write(**last_measurement)
+        await self.evt_positionPublish.set_write(
+            target=last_measurement.target,
+            dX=last_measurement.dX,
+            dY=last_measurement.dY,
+            dZ=last_measurement.dZ,
+            dRX=last_measurement.dRX,
+            dRY=last_measurement.dRY,
+            dRZ=last_measurement.dRZ,
+        )
 
     def get_target_name(self, target: str) -> str:
         """Return target frame name from target name.
@@ -343,18 +382,19 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_align.DataType``
             Command data.
         """
-        self.assert_enabled()
+        model = self.assert_enabled_with_model()
 
-        assert self.model is not None
+        try:
+            target = Target(data.target)
+        except ValueError as e:
+            raise salobj.ExpectedError(f"Invalid target {data.target}.") from e
 
         await self.cmd_align.ack_in_progress(
             data,
-            timeout=self.model.read_timeout,
+            timeout=model.read_timeout,
             result=f"Aligning {data.target}.",
         )
 
-        target = Target(data.target)
-
         ack_task = asyncio.create_task(self._ack_align_in_progress(data))
 
         try:
@@ -386,27 +426,29 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_healthcheck.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
 
         self.log.info("Running health check.")
+        # The T2SA executes one measurement plan at a time and rejects a new
+        # one while another is running, so the checks cannot be run
+        # concurrently.
         for target in self.config.targets:
             await self.cmd_healthCheck.ack_in_progress(
                 data,
-                timeout=self.model.read_timeout,
+                timeout=model.read_timeout,
                 result=f"Running two face check for {target}.",
             )
 
-            self.log.debug(f"Running two face check for {target}.")
-            await self.model.twoface_check(target)
+            self.log.debug("Running two face check for %s.", target)
+            await model.twoface_check(target)
 
             await self.cmd_healthCheck.ack_in_progress(
                 data,
-                timeout=self.model.read_timeout,
+                timeout=model.read_timeout,
                 result=f"Measuring drift for {target}.",
             )
-            self.log.debug(f"Measuring drift for {target}.")
-            await self.model.measure_drift(target)
+            self.log.debug("Measuring drift for %s.", target)
+            await model.measure_drift(target)
 
     async def do_laserPower(self, data: salobj.BaseDdsDataType) -> None:
         """Power laser on/off.
@@ -416,12 +458,11 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_laserPower``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
         if data.power == 0:
-            await self.model.laser_off()
+            await model.laser_off()
         else:
-            await self.model.laser_on()
+            await model.laser_on()
 
     async def do_powerOff(self, data: salobj.BaseDdsDataType) -> None:
         """Fully power off tracker and interface.
@@ -451,10 +492,9 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_measuerPoint.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
 
-        measurement = await self.model.measure_single_point(
+        measurement = await model.measure_single_point(
             data.collection, data.pointgroup, data.target
         )
 
@@ -476,9 +516,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_pointDelta.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        point_delta = await self.model.get_point_delta(
+        model = self.assert_enabled_with_model()
+        point_delta = await model.get_point_delta(
             p1collection=data.collection_A,
             p1group=data.pointgroup_A,
             p1=data.target_A,
@@ -499,9 +538,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_setReferenceGroup.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        await self.model.set_reference_group(data.referenceGroup)
+        model = self.assert_enabled_with_model()
+        await model.set_reference_group(data.referenceGroup)
 
         # TODO (DM-36112): Publish reference group
         self.log.info(f"New reference group: {data.referenceGroup}")
@@ -514,9 +552,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_setWorkingFrame.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        await self.model.set_working_frame(data.workingFrame)
+        model = self.assert_enabled_with_model()
+        await model.set_working_frame(data.workingFrame)
 
         # TODO (DM-36112): Publish an event with the working frame.
 
@@ -528,9 +565,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_halt.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        await self.model.halt()
+        model = self.assert_enabled_with_model()
+        await model.halt()
 
     async def do_loadSATemplateFile(self, data: salobj.BaseDdsDataType) -> None:
         """Load SA Template file.
@@ -540,9 +576,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_loadSATemplateFile.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        await self.model.load_template_file(data.file)
+        model = self.assert_enabled_with_model()
+        await model.load_template_file(data.file)
 
         # TODO (DM-36112): Publish something?
 
@@ -554,9 +589,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_measureDrift.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
-        await self.model.measure_drift(data.pointgroup)
+        model = self.assert_enabled_with_model()
+        await model.measure_drift(data.pointgroup)
 
         # TODO (DM-36112): Publish something?
 
@@ -568,10 +602,9 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_resetT2SA.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
 
-        await self.model.reset_t2sa()
+        await model.reset_t2sa()
 
         # TODO (DM-36112): Publish something?
 
@@ -583,10 +616,9 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_newStation.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
 
-        await self.model.new_station()
+        await model.new_station()
 
         # TODO (DM-36112): Publish something?
 
@@ -598,10 +630,9 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
         data : ``cmd_saveJobFile.DataType``
             Command data.
         """
-        self.assert_enabled()
-        assert self.model is not None
+        model = self.assert_enabled_with_model()
 
-        await self.model.save_sa_jobfile(data.file)
+        await model.save_sa_jobfile(data.file)
 
         # TODO (DM-36112): Publish something?
 
@@ -616,6 +647,10 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
 
         assert self.model is not None
 
+        # The steps below cannot be overlapped: T2SAModel serializes all
+        # commands on a single connection, the T2SA runs one measurement
+        # plan at a time, and the measured frame names depend on the
+        # telescope position and group index set before each measurement.
         await self.set_telescope_position()
 
         self.group_idx += 1
@@ -653,20 +688,28 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
 
         # Remove Zeropoint from offset
         if target == "M2":
-            target_offset["dX"] -= self.config.zero_points["m2"]["x"]
-            target_offset["dY"] -= self.config.zero_points["m2"]["y"]
-            target_offset["dZ"] -= self.config.zero_points["m2"]["z"]
-            target_offset["dRX"] -= self.config.zero_points["m2"]["u"]
-            target_offset["dRY"] -= self.config.zero_points["m2"]["v"]
+            target_offset.dX -= self.config.zero_points["m2"]["x"]
+            target_offset.dY -= self.config.zero_points["m2"]["y"]
+            target_offset.dZ -= self.config.zero_points["m2"]["z"]
+            target_offset.dRX -= self.config.zero_points["m2"]["u"]
+            target_offset.dRY -= self.config.zero_points["m2"]["v"]
         elif target == "CAM":
-            target_offset["dX"] -= self.config.zero_points["camera"]["x"]
-            target_offset["dY"] -= self.config.zero_points["camera"]["y"]
-            target_offset["dZ"] -= self.config.zero_points["camera"]["z"]
-            target_offset["dRX"] -= self.config.zero_points["camera"]["u"]
-            target_offset["dRY"] -= self.config.zero_points["camera"]["v"]
-
-        target_offset["force_output"] = True
-        await self.evt_offsetsPublish.set_write(**target_offset)
+            target_offset.dX -= self.config.zero_points["camera"]["x"]
+            target_offset.dY -= self.config.zero_points["camera"]["y"]
+            target_offset.dZ -= self.config.zero_points["camera"]["z"]
+            target_offset.dRX -= self.config.zero_points["camera"]["u"]
+            target_offset.dRY -= self.config.zero_points["camera"]["v"]
+
+        await self.evt_offsetsPublish.set_write(
+            target=target_offset.target,
+            dX=target_offset.dX,
+            dY=target_offset.dY,
+            dZ=target_offset.dZ,
+            dRX=target_offset.dRX,
+            dRY=target_offset.dRY,
+            dRZ=target_offset.dRZ,
+            force_output=True,
+        )
 
     async def set_telescope_position(self) -> None:
         """Set the telescope positions by retrieving values from the mtmount
@@ -732,30 +775,44 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
 
         assert self.model is not None
 
+        model = self.model
+        laser_status_ready = self.laser_status_ready
+        heartbeat_interval = self.heartbeat_interval
+        # Last invalid laser status reported, to avoid repeating the warning
+        # every heartbeat.
+        invalid_laser_status = None
+
         while self._run_telemetry_loop:
             try:
-                status = await self.model.get_status()
-                t2sa_status = T2SAStatus(getattr(T2SAStatus, status))
+                status = await model.get_status()
+                t2sa_status = T2SAStatus[status]
                 if t2sa_status == T2SAStatus.READY:
-                    self.laser_status_ready.set()
+                    laser_status_ready.set()
                 else:
-                    self.laser_status_ready.clear()
+                    laser_status_ready.clear()
 
                 await self.evt_t2saStatus.set_write(status=t2sa_status)
 
-                status = await self.model.laser_status()
+                status = await model.laser_status()
 
                 if reg_exp_lsta_off.match(status) is not None:
                     laser_status = LaserStatus.OFF
+                    invalid_laser_status = None
                 elif reg_exp_lsta_on.match(status) is not None:
                     laser_status = LaserStatus.ON
+                    invalid_laser_status = None
                 else:
-                    self.log.warning(f"Invalid Laser Status: {status}")
+                    # Ignore details after the status name, e.g. the
+                    # remaining time in "WARM, 10.00 seconds".
+                    status_name = status.split(",", 1)[0]
+                    if status_name != invalid_laser_status:
+                        self.log.warning(f"Invalid Laser Status: {status}")
+                        invalid_laser_status = status_name
                     laser_status = LaserStatus.NOT_CONNECTED
 
                 await self.evt_laserStatus.set_write(status=laser_status)
 
-                await asyncio.sleep(self.heartbeat_interval)
+                await asyncio.sleep(heartbeat_interval)
             except Exception:
                 await self.fault(
                     code=ErrorCodes.TELEMETRY_LOOP_ERROR,
@@ -779,7 +836,8 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
             self._run_telemetry_loop = False
             wait_finish_interval = self.heartbeat_interval * 2
             self.log.debug(
-                f"Telemetry loop task still running. Waiting {wait_finish_interval}s for it to finish."
+                "Telemetry loop task still running. Waiting %ss for it to finish.",
+                wait_finish_interval,
             )
             try:
                 await asyncio.wait_for(
@@ -787,28 +845,20 @@ class LaserTrackerCsc(salobj.ConfigurableCsc):
                 )
             except asyncio.TimeoutError:
                 # TimeoutError might happen if the tasks takes too long to
-                # finish. Will cancel it and move forward.
-                self.log.debug("Telemetry loop did not finished, cancelling it.")
-                self.telemetry_loop_task.cancel()
-                try:
-                    await self.telemetry_loop_task
-                except asyncio.CancelledError:
-                    # CancelledError is expected since we canceled it.
-                    pass
-                except Exception:
-                    # Any other exception is unexpected. Will log and continue.
-                    self.log.exception("Error cancelling telemetry loop. Ignoring...")
+                # finish. wait_for has already cancelled the task and waited
+                # for it to finish, so just move forward.
+                self.log.debug("Telemetry loop did not finish; it was cancelled.")
             except Exception:
                 # Any other exception is unexpected. Will log and continue.
                 self.log.exception("Error finalizing telemetry. Ignoring...")
 
-    def in_tolerance(self, coords: dict[str, str | float]) -> bool:
+    def in_tolerance(self, coords: Offsets) -> bool:
         """Returns true if the specified coords are in tolerance.
 
         Parameters
         ----------
-        coords : `Dict`
-            Dict containing coordinates
+        coords : `Offsets`
+            Target offsets.
         """
         raise NotImplementedError()
 
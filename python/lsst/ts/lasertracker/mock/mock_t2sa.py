@@ -43,6 +43,39 @@ T2SA_REPLY_READY = "READY"
 # that does not match a non-busy status.
 BUSY_STATUS = "_BUSY_"
 
+# Regular expressions to parse the arguments of each command handled by a
+# `MockT2SA` method, by command name. Fields separated by ";" may not
+# contain ";", and patterns with several fields must match the whole
+# argument string.
+COMMAND_ARGS_REGEXES = {
+    "!2FACE_CHECK": re.compile(r"(?P<point_group>.*)"),
+    "!CMDEXE": re.compile(r"(?P<point_group>.*)"),
+    "!HALT": re.compile(""),
+    "!LOAD_SA_TEMPLATE_FILE": re.compile(r"(?P<file_path>.*)"),
+    "!LST": re.compile(r"(?P<value>.*)"),
+    "!MEAS_DRIFT": re.compile(r"(?P<point_group>.*)"),
+    "!MEAS_SINGLE_POINT": re.compile(
+        r"(?P<collection>[^;]*);(?P<point_group>[^;]*);(?P<point_n>[^;]*)\Z"
+    ),
+    "!PUBLISH_ALT_AZ_ROT": re.compile(r"(?P<alt>[^;]*);(?P<az>[^;]*);(?P<rot>[^;]*)\Z"),
+    "!SAVE_SA_JOBFILE": re.compile(r"(?P<filename>.*)"),
+    "!SET_REFERENCE_GROUP": re.compile(r"(?P<reference_group>.*)"),
+    "!SET_WORKING_FRAME": re.compile(r"(?P<working_frame>.*)"),
+    "?LSTA": re.compile(""),
+    "?OFFSET": re.compile(r"(?P<point_group>[^;]*);(?P<reference_group>[^;]*)\Z"),
+    "?POINT_DELTA": re.compile(
+        r"(?P<p1collection>[^;]*);(?P<p1group>[^;]*);(?P<p1>[^;]*);"
+        r"(?P<p2collection>[^;]*);(?P<p2group>[^;]*);(?P<p2>[^;]*)\Z"
+    ),
+    "?POS": re.compile(r"(?P<point_group>.*)"),
+    "?STAT": re.compile(""),
+    "!SET_MEAS_INDEX": re.compile(r"(?P<index>[0-9]+)\Z"),
+    "!INC_MEAS_INDEX": re.compile(r"(?P<increment>[0-9]+)\Z"),
+}
+
+# Parse a point name, e.g. "M1M3_P3", into its group and index.
+COLLECTION_POINT_REGEX = re.compile(r"(?P<group>.*)_P(?P<index>[0-9]+)\Z")
+
 
 class MockT2SA(tcpip.OneClientServer):
     """Emulate a New River Kinematics T2SA application.
@@ -97,64 +130,29 @@ class MockT2SA(tcpip.OneClientServer):
         }
 
         self.dispatchers: dict[str, tuple[typing.Any, re.Pattern]] = {
-            name: (method, re.compile(regex_str))
-            for name, method, regex_str in (
-                ("!2FACE_CHECK", self.execute_two_face_check, r"(?P<point_group>.*)"),
-                ("!CMDEXE", self.execute_measure_plan, r"(?P<point_group>.*)"),
-                ("!HALT", self.execute_halt, ""),
-                (
-                    "!LOAD_SA_TEMPLATE_FILE",
-                    self.execute_load_sa_template_file,
-                    r"(?P<file_path>.*)",
-                ),
-                ("!LST", self.execute_set_power, r"(?P<value>.*)"),
-                ("!MEAS_DRIFT", self.execute_drift, r"(?P<point_group>.*)"),
-                (
-                    "!MEAS_SINGLE_POINT",
-                    self.execute_measure_single_point,
-                    r"(?P<collection>.*);(?P<point_group>.*);(?P<point_n>.*)",
-                ),
-                (
-                    "!PUBLISH_ALT_AZ_ROT",
-                    self.execute_set_alt_az_rot,
-                    r"(?P<alt>.*);(?P<az>.*);(?P<rot>.*)",
-                ),
-                ("!SAVE_SA_JOBFILE", self.execute_save_sa_jobfile, r"(?P<filename>.*)"),
-                (
-                    "!SET_REFERENCE_GROUP",
-                    self.execute_set_reference_group,
-                    r"(?P<reference_group>.*)",
-                ),
-                (
-                    "!SET_WORKING_FRAME",
-                    self.execute_set_working_frame,
-                    r"(?P<working_frame>.*)",
-                ),
-                ("?LSTA", self.execute_get_laser_status, ""),
-                (
-                    "?OFFSET",
-                    self.execute_write_point_group_offset,
-                    r"(?P<point_group>.*);(?P<reference_group>.*)",
-                ),
-                (
-                    "?POINT_DELTA",
-                    self.execute_measure_point_delta,
-                    r"(?P<p1collection>.*);(?P<p1group>.*);(?P<p1>.*);"
-                    r"(?P<p2collection>.*);(?P<p2group>.*);(?P<p2>.*)",
-                ),
-                (
-                    "?POS",
-                    self.execute_write_point_group_position,
-                    r"(?P<point_group>.*)",
-                ),
-                ("?STAT", self.execute_write_status, ""),
-                ("!SET_MEAS_INDEX", self.set_mean_index, r"(?P<index>[0-9]*)"),
-                ("!INC_MEAS_INDEX", self.inc_meas_index, r"(?P<increment>[0-9]*)"),
+            name: (method, COMMAND_ARGS_REGEXES[name])
+            for name, method in (
+                ("!2FACE_CHECK", self.execute_two_face_check),
+                ("!CMDEXE", self.execute_measure_plan),
+                ("!HALT", self.execute_halt),
+                ("!LOAD_SA_TEMPLATE_FILE", self.execute_load_sa_template_file),
+                ("!LST", self.execute_set_power),
+                ("!MEAS_DRIFT", self.execute_drift),
+                ("!MEAS_SINGLE_POINT", self.execute_measure_single_point),
+                ("!PUBLISH_ALT_AZ_ROT", self.execute_set_alt_az_rot),
+                ("!SAVE_SA_JOBFILE", self.execute_save_sa_jobfile),
+                ("!SET_REFERENCE_GROUP", self.execute_set_reference_group),
+                ("!SET_WORKING_FRAME", self.execute_set_working_frame),
+                ("?LSTA", self.execute_get_laser_status),
+                ("?OFFSET", self.execute_write_point_group_offset),
+                ("?POINT_DELTA", self.execute_measure_point_delta),
+                ("?POS", self.execute_write_point_group_position),
+                ("?STAT", self.execute_write_status),
+                ("!SET_MEAS_INDEX", self.set_mean_index),
+                ("!INC_MEAS_INDEX", self.inc_meas_index),
             )
         }
 
-        self.collection_point_regexp = re.compile(r"(?P<group>.*)_P(?P<index>.*)")
-
         duplicate_keys = self.dispatchers.keys() & self.canned_replies.keys()
         if duplicate_keys:
             raise RuntimeError(
@@ -277,13 +275,16 @@ class MockT2SA(tcpip.OneClientServer):
             Point group to measure (e.g. M1M3, M2, CAM).
         """
         try:
-            self.log.debug(f"Executing measurement plan for {point_group=}.")
+            self.log.debug(
+                "Executing measurement plan for point_group=%r.", point_group
+            )
             await self._execute_action(BUSY_STATUS, point_group)
         except Exception:
             self.log.exception("Error execution action.")
         else:
             self.log.debug(
-                f"Measurement plan for {point_group=} completed successfully."
+                "Measurement plan for point_group=%r completed successfully.",
+                point_group,
             )
             await self._write_reply(f"ACK-106 Successfully ran CMD {point_group}")
 
@@ -325,7 +326,7 @@ class MockT2SA(tcpip.OneClientServer):
         point_group : `str`
             Point group the action is being executed for.
         """
-        self.log.debug(f"Executing {action} for {point_group}.")
+        self.log.debug("Executing %s for %s.", action, point_group)
 
         # Schedule task that will emulate measurement in the background
         if not self.measure_task.done():
@@ -380,7 +381,7 @@ class MockT2SA(tcpip.OneClientServer):
             New measurement index as a string, will be converted to an int.
         """
         self.log.debug(
-            f"Setting measurement index {self.measurement_index} -> {index}."
+            "Setting measurement index %s -> %s.", self.measurement_index, index
         )
         self.measurement_index = int(index)
 
@@ -593,7 +594,7 @@ class MockT2SA(tcpip.OneClientServer):
             Error message from parsing the point name. Empty if no error.
         """
         try:
-            collection_point_match = self.collection_point_regexp.match(point_name)
+            collection_point_match = COLLECTION_POINT_REGEX.match(point_name)
             assert collection_point_match is not None
 
             collection_point = collection_point_match.groupdict()
@@ -813,7 +814,7 @@ class MockT2SA(tcpip.OneClientServer):
         try:
             while self.connected:
                 command_bytes = await self.readline()
-                self.log.debug(f"Mock T2SA received command: {command_bytes}")
+                self.log.debug("Mock T2SA received command: %s", command_bytes)
                 if not command_bytes:
                     self.log.info(
                         "read loop ending; null data read indicates client hung up"
@@ -989,7 +990,7 @@ class MockT2SA(tcpip.OneClientServer):
         if self.is_ready():
             self.log.info("Laser already warm.")
         else:
-            self.log.debug(f"Warming laser up. Will take: {self.laser_warmup_time}s")
+            self.log.debug("Warming laser up. Will take: %ss", self.laser_warmup_time)
             self._laser_warmup_start_tai = utils.current_tai()
             await asyncio.sleep(self.laser_warmup_time)
             self.log.debug("Laser warm up completed.")
@@ -1009,7 +1010,7 @@ class MockT2SA(tcpip.OneClientServer):
 
         await command_handler(**command_kwargs)
 
-    def _parse_command(self, command: str) -> tuple[typing.Any, dict[str, str]]:
+    def _parse_command(self, command: str) -> tuple[typing.Any, dict[str, typing.Any]]:
         """Parse a command from the client.
 
         Parameters
@@ -1021,8 +1022,10 @@ class MockT2SA(tcpip.OneClientServer):
         -------
         command_handler : `object`
             An awaitable method that handles the command.
-        command_kwargs : `dict`[`str`, `str`]
+        command_kwargs : `dict`[`str`, `typing.Any`]
             Dictionary with keywords arguments to pass to ``command_handler``.
+            If the command is unsupported or its arguments cannot be parsed,
+            ``command_handler`` writes an error reply.
         """
         command_name, _, args_str = (
             command.partition(" ")
@@ -1031,13 +1034,16 @@ class MockT2SA(tcpip.OneClientServer):
         )
         command_handler, args_regex = self.dispatchers.get(command_name, (None, None))
 
+        command_kwargs: dict[str, typing.Any]
         if args_regex is not None:
             command_args_match = args_regex.match(args_str)
-            command_kwargs = (
-                command_args_match.groupdict()
-                if command_args_match is not None
-                else dict()
-            )
+            if command_args_match is not None:
+                command_kwargs = command_args_match.groupdict()
+            else:
+                err_msg = f"Cannot parse arguments of command {command!r}"
+                self.log.error(err_msg)
+                command_handler = self.write_error_reply
+                command_kwargs = dict(code=T2SAErrorCode.CommandRejected, reply=err_msg)
         else:
             canned_reply = self.canned_replies.get(command)
             if canned_reply is not None:
@@ -1047,6 +1053,6 @@ class MockT2SA(tcpip.OneClientServer):
                 err_msg = f"Unsupported command {command!r}"
                 self.log.error(err_msg)
                 command_handler = self.write_error_reply
-                command_kwargs = dict(reply=err_msg)
+                command_kwargs = dict(code=T2SAErrorCode.CommandRejected, reply=err_msg)
 
         return (command_handler, command_kwargs)
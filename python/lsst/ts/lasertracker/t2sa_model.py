@@ -23,14 +23,19 @@ __all__ = ["LaserStatus", "TrackerStatus", "T2SAError", "T2SAModel"]
 
 import asyncio
 import logging
-import re
+import socket
 import time
 from enum import IntEnum
 
 from lsst.ts import tcpip
 
 from .enums import T2SAErrorCode
-from .utils import CartesianCoordinate, parse_offsets, parse_single_point_measurement
+from .utils import (
+    CartesianCoordinate,
+    Offsets,
+    parse_offsets,
+    parse_single_point_measurement,
+)
 
 # Log a warning if it takes longer than this (seconds) to read a reply
 LOG_WARNING_TIMEOUT = 5
@@ -38,6 +43,36 @@ LOG_WARNING_TIMEOUT = 5
 # The error code returned by the T2SA if busy, as a string
 BUSY_ERR_CODE_STR = str(T2SAErrorCode.CommandRejectedBusy.value)
 
+# Prefixes of a reply from the T2SA, e.g. "ACK-300 READY".
+REPLY_TYPES = ("ACK-", "ERR-")
+
+# Commands that take no arguments, and on/off commands with each value,
+# encoded and terminated once.
+FIXED_COMMANDS = {
+    cmd: cmd.encode() + tcpip.TERMINATOR
+    for cmd in (
+        "?STAT",
+        "?LSTA",
+        "!LST:0",
+        "!LST:1",
+        "!LST:2",
+        "!SET_SIM:0",
+        "!SET_SIM:1",
+        "SET_RANDOMIZE_POINTS:0",
+        "SET_RANDOMIZE_POINTS:1",
+        "SET_POWER_LOCK:0",
+        "SET_POWER_LOCK:1",
+        "!SET_STATION_LOCK:0",
+        "!SET_STATION_LOCK:1",
+        "!CLERCL",
+        "!NEW_STATION",
+        "!RESET_T2SA",
+        "!HALT",
+        "!APPLY_ALT_AZ_ROT:CAM",
+        "!SAVE_SETTINGS",
+    )
+}
+
 
 class LaserStatus(IntEnum):
     LASERNOTCONNECTED = -1
@@ -105,17 +140,21 @@ class T2SAModel:
 
         self.reader: None | asyncio.StreamReader = None
         self.writer: None | asyncio.StreamWriter = None
-        self.first_measurement = True
         self.comm_lock = asyncio.Lock()
-        self.reply_regex = re.compile(r"(ACK|ERR)-(\d\d\d) +(.*)")
 
     async def connect(self) -> None:
         """Connect to the T2SA.
 
         After the connection is established, set the t2sa simulation mode, this
         is the t2sa controller own simulation mode.
+
+        Nagle's algorithm is disabled on the socket, since all commands are
+        short request/reply exchanges that should not be delayed.
         """
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         await self.set_t2sa_simulation_mode()
 
     @property
@@ -140,9 +179,15 @@ class T2SAModel:
                 self.writer = None
 
     async def handle_lost_connection(self) -> None:
-        """Handle a connection that is unexpectedly lost."""
+        """Handle a connection that is unexpectedly lost.
+
+        Close the stream writer, if any, and forget the streams, so that
+        `connected` is False and `connect` can be called again.
+        """
         if self.writer is not None:
             await tcpip.close_stream_writer(self.writer)
+        self.reader = None
+        self.writer = None
 
     async def send_command(self, cmd: str) -> str:
         """Send a command and return the reply.
@@ -190,12 +235,21 @@ class T2SAModel:
         if not self.connected:
             raise RuntimeError("Not connected")
 
-        assert self.writer is not None
+        writer = self.writer
+        assert writer is not None
 
-        cmd_bytes = cmd.encode() + tcpip.TERMINATOR
-        self.log.debug(f"Send command {cmd_bytes!r}")
-        self.writer.write(cmd_bytes)
-        await self.writer.drain()
+        cmd_bytes = FIXED_COMMANDS.get(cmd)
+        if cmd_bytes is None:
+            cmd_bytes = cmd.encode() + tcpip.TERMINATOR
+        self.log.debug("Send command %r", cmd_bytes)
+        try:
+            writer.write(cmd_bytes)
+            await writer.drain()
+        except ConnectionError as e:
+            err_msg = f"Connection lost while sending command {cmd}"
+            self.log.error(err_msg)
+            await self.handle_lost_connection()
+            raise RuntimeError(err_msg) from e
 
         if no_wait_reply:
             return ""
@@ -223,13 +277,13 @@ class T2SAModel:
         If the code times out while waiting for a reply then the connection
         is closed.
         """
-        assert self.reader is not None
+        reader = self.reader
+        if reader is None:
+            raise RuntimeError(f"Not connected; cannot read reply to {cmd}")
         try:
             t0 = time.monotonic()
-            reply_bytes = await asyncio.wait_for(
-                self.reader.readuntil(separator=tcpip.TERMINATOR),
-                timeout=self.read_timeout,
-            )
+            async with asyncio.timeout(self.read_timeout):
+                reply_bytes = await reader.readuntil(separator=tcpip.TERMINATOR)
             dt = time.monotonic() - t0
             if dt > LOG_WARNING_TIMEOUT:
                 self.log.warning(
@@ -237,12 +291,12 @@ class T2SAModel:
                     f"in response to command {cmd}"
                 )
             else:
-                self.log.debug(f"Received reply: {reply_bytes!r}")
-        except (asyncio.IncompleteReadError, ConnectionResetError):
+                self.log.debug("Received reply: %r", reply_bytes)
+        except (asyncio.IncompleteReadError, ConnectionResetError) as e:
             err_msg = f"Connection lost while executing command {cmd}"
             self.log.error(err_msg)
             await self.handle_lost_connection()
-            raise RuntimeError(err_msg)
+            raise RuntimeError(err_msg) from e
         except asyncio.TimeoutError:
             err_msg = (
                 f"Timed out while waiting for a reply to command {cmd}. "
@@ -251,12 +305,20 @@ class T2SAModel:
             self.log.error(err_msg)
             raise RuntimeError(err_msg)
 
-        reply_str = reply_bytes.decode().strip()
-        reply_match = self.reply_regex.match(reply_str)
-        if reply_match is None:
+        reply_str = reply_bytes.strip().decode()
+        # A reply is "ACK-nnn <body>" or "ERR-nnn <body>", where nnn is a
+        # three digit code followed by one or more spaces.
+        reply_type = reply_str[:4]
+        reply_code = reply_str[4:7]
+        if (
+            reply_type not in REPLY_TYPES
+            or len(reply_code) != 3
+            or not reply_code.isdecimal()
+            or reply_str[7:8] != " "
+        ):
             raise RuntimeError(f"Cannot parse reply {reply_str!r}")
-        reply_type, reply_code, reply_body = reply_match.groups()
-        if reply_type == "ACK":
+        reply_body = reply_str[8:].lstrip(" ")
+        if reply_type == "ACK-":
             return reply_body
         else:
             raise T2SAError(error_code=int(reply_code), message=reply_body)
@@ -376,7 +438,7 @@ class T2SAModel:
         """
         return await self.send_command(f"!CMDEXE:{target}")
 
-    async def get_target_position(self, target: str) -> dict[str, str | float]:
+    async def get_target_position(self, target: str) -> Offsets:
         """Get the position of the specified target.
 
         You should measure the point using `measure_target` before calling
@@ -390,9 +452,8 @@ class T2SAModel:
 
         Returns
         -------
-        target_position : `dict` [`str`, `str` | `float`]
-            Position of target, as a point coordinate string, relative to the
-            current working frame.
+        target_position : `Offsets`
+            Position of target, relative to the current working frame.
 
         Raises
         ------
@@ -426,7 +487,7 @@ class T2SAModel:
 
     async def get_target_offset(
         self, target: str, reference_pointgroup: None | str = None
-    ) -> dict[str, str | float]:
+    ) -> Offsets:
         """Get the offset of a target from nominal.
 
         Parameters
@@ -439,7 +500,7 @@ class T2SAModel:
 
         Returns
         -------
-        target_offset : `dict` [`str`, `str` | `float`]
+        target_offset : `Offsets`
             Target offset information.
 
         Raise
@@ -22,6 +22,7 @@
 __all__ = [
     "BodyRotation",
     "CartesianCoordinate",
+    "Offsets",
     "parse_offsets",
     "parse_single_point_measurement",
     "Target",
@@ -34,12 +35,14 @@ from dataclasses import dataclass
 import numpy as np
 
 SINGLE_POINT_MEASURE_REGEX = re.compile(
-    r"Single Point Measurement (.*) result (?P<x>.*),(?P<y>.*),(?P<z>.*) (.*) (.*) (.*)"
+    r"Single Point Measurement (.*) result "
+    r"(?P<x>[^, ]+),\s*(?P<y>[^, ]+),\s*(?P<z>[^, ]+) (.*) (.*) (.*)"
 )
 
 OFFSET_MEASURE_REGEX = re.compile(
-    r"Object Offset Report (?P<target>.*);X:(?P<dX>.*);Y:(?P<dY>.*);Z:(?P<dZ>.*);"
-    r"Rx:(?P<dRX>.*);Ry:(?P<dRY>.*);Rz:(?P<dRZ>.*);(.*) (.*)"
+    r"Object Offset Report (?P<target>[^;]*);X:(?P<dX>[^;]*);Y:(?P<dY>[^;]*);"
+    r"Z:(?P<dZ>[^;]*);Rx:(?P<dRX>[^;]*);Ry:(?P<dRY>[^;]*);Rz:(?P<dRZ>[^;]*);"
+    r"(.*) (.*)"
 )
 
 MEASURE_REGEX = re.compile(
@@ -89,6 +92,30 @@ class BodyRotation:
         return np.radians(np.array([self.u, self.v, self.w]))
 
 
+@dataclass
+class Offsets:
+    """Position or offset of a target, as reported by the T2SA.
+
+    Field names match those of the ``positionPublish`` and
+    ``offsetsPublish`` events.
+    """
+
+    "Name of the target frame"
+    target: str
+    "Offset along x"
+    dX: float
+    "Offset along y"
+    dY: float
+    "Offset along z"
+    dZ: float
+    "Rotation about x, in deg"
+    dRX: float
+    "Rotation about y, in deg"
+    dRY: float
+    "Rotation about z, in deg"
+    dRZ: float
+
+
 def parse_single_point_measurement(
     measurement: str,
 ) -> CartesianCoordinate:
@@ -115,16 +142,17 @@ def parse_single_point_measurement(
         raise RuntimeError(f"Failed to parse measurement: {measurement}")
 
     return CartesianCoordinate(
-        **dict([(k, float(v)) for k, v in measure_match.groupdict().items()])
+        x=float(measure_match["x"]),
+        y=float(measure_match["y"]),
+        z=float(measure_match["z"]),
     )
 
 
 def parse_offsets(
     measurement: str,
-) -> dict[str, str | float]:
-    """Takes a string containing spatial coordinates  from T2SA, and
-    returns a dict with the following keys: RefFrame, X, Y, Z, Rx, Ry, Rz,
-    and Timestamp.
+) -> Offsets:
+    """Takes a string containing spatial coordinates from T2SA, and
+    returns the target name and the x, y, z offsets and rotations.
 
     Parameters
     ----------
@@ -139,7 +167,7 @@ def parse_offsets(
 
     Returns
     -------
-    offset : `dict` [`str`, `str` | `float`]
+    offset : `Offsets`
         Offsets obtained after parsing the input string.
 
     Raises
@@ -151,9 +179,12 @@ def parse_offsets(
     if measure_match is None:
         raise RuntimeError(f"Failed to parse measurement: {measurement}")
 
-    return dict(
-        [
-            (key, float(value) if key != "target" else value)
-            for key, value in measure_match.groupdict().items()
-        ]
+    return Offsets(
+        target=measure_match["target"],
+        dX=float(measure_match["dX"]),
+        dY=float(measure_match["dY"]),
+        dZ=float(measure_match["dZ"]),
+        dRX=float(measure_match["dRX"]),
+        dRY=float(measure_match["dRY"]),
+        dRZ=float(measure_match["dRZ"]),
     )
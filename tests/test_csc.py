@@ -24,6 +24,7 @@ import logging
 import pathlib
 import typing
 import unittest
+import unittest.mock
 
 import numpy as np
 import pytest
@@ -263,6 +264,45 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
                 ],
             )
 
+    async def test_start_retry_after_failed_connection(self) -> None:
+        async with self.make_csc(
+            index=SalIndex.OTHER,
+            config_dir=TEST_CONFIG_DIR,
+            initial_state=salobj.State.STANDBY,
+            override="",
+            simulation_mode=2,
+        ):
+            connect = lasertracker.T2SAModel.connect
+            num_connect_calls = 0
+
+            async def fail_first_connect(model: lasertracker.T2SAModel) -> None:
+                nonlocal num_connect_calls
+                num_connect_calls += 1
+                if num_connect_calls == 1:
+                    raise ConnectionRefusedError("Simulated connection failure.")
+                await connect(model)
+
+            with unittest.mock.patch.object(
+                lasertracker.T2SAModel, "connect", fail_first_connect
+            ):
+                with pytest.raises(salobj.AckError):
+                    await self.remote.cmd_start.start(timeout=STD_TIMEOUT)
+                assert self.csc.summary_state == salobj.State.STANDBY
+                model = self.csc.model
+                mock_t2sa = self.csc._mock_t2sa
+                assert model is not None
+                assert mock_t2sa is not None
+
+                await self.remote.cmd_start.start(timeout=STD_TIMEOUT)
+
+            assert self.csc.summary_state == salobj.State.DISABLED
+            assert num_connect_calls == 2
+            # The retry reuses the model, still pointing at the same mock.
+            assert self.csc.model is model
+            assert self.csc._mock_t2sa is mock_t2sa
+            assert (model.host, model.port) == (mock_t2sa.host, mock_t2sa.port)
+            assert model.connected
+
     async def test_laser_power(self) -> None:
         async with self.make_csc(
             index=SalIndex.MTAlignment,
@@ -290,6 +330,37 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
             assert self.csc._mock_t2sa.laser_status == "LOFF"
             assert self.csc._mock_t2sa.laser_warmup_task.done()
 
+    async def test_laser_status_warning_once_per_warmup(self) -> None:
+        async with self.make_csc(
+            index=SalIndex.MTAlignment,
+            initial_state=salobj.State.ENABLED,
+            override="",
+            config_dir=TEST_CONFIG_DIR,
+            simulation_mode=2,
+        ):
+            # Warm up for several heartbeats, so the telemetry loop sees the
+            # WARM laser status more than once in each warmup.
+            heartbeat_interval = self.csc.heartbeat_interval
+            laser_warmup_time = 4 * heartbeat_interval
+
+            with self.assertLogs(self.csc.log, level=logging.WARNING) as csc_logs:
+                for _ in range(2):
+                    await self.quick_power_on(
+                        laser_warmup_time=laser_warmup_time, wait_warmup=True
+                    )
+                    # Give the telemetry loop time to see the LON status.
+                    await asyncio.sleep(2 * heartbeat_interval)
+                    await self.remote.cmd_laserPower.set_start(
+                        power=0, timeout=STD_TIMEOUT
+                    )
+
+            warm_warnings = [
+                log
+                for log in csc_logs.output
+                if log.startswith("WARNING:LaserTracker:Invalid Laser Status: WARM")
+            ]
+            assert len(warm_warnings) == 2
+
     async def test_measure_point_laser_off(self) -> None:
         async with self.make_csc(
             index=SalIndex.MTAlignment,
@@ -22,7 +22,9 @@
 import asyncio
 import logging
 import unittest
+import unittest.mock
 
+import pytest
 from lsst.ts import lasertracker
 from lsst.ts.tcpip import LOCAL_HOST
 
@@ -91,3 +93,98 @@ class ModelTestCase(unittest.IsolatedAsyncioTestCase):
         assert response == "LON"
 
         await self.model.disconnect()
+
+    async def test_malformed_command_arguments(self) -> None:
+        """Tests the mock T2SA rejects commands with malformed arguments."""
+        self.model = lasertracker.T2SAModel(
+            host=LOCAL_HOST,
+            port=self.mock_t2sa.port,
+            read_timeout=STANDARD_TIMEOUT,
+            t2sa_simulation_mode=1,
+            log=self.log,
+        )
+        await self.model.connect()
+
+        for command in (
+            "!MEAS_SINGLE_POINT:A;M1M3",
+            "?OFFSET:FRAMEM2;FRAMEM1M3;extra",
+            "!PUBLISH_ALT_AZ_ROT:0.0;60.0;0.0;1.0",
+            "!SET_MEAS_INDEX:abc",
+            "!INC_MEAS_INDEX:1x",
+        ):
+            with self.subTest(command=command):
+                with pytest.raises(lasertracker.T2SAError) as excinfo:
+                    await self.model.send_command(command)
+                assert (
+                    excinfo.value.error_code
+                    == lasertracker.T2SAErrorCode.CommandRejected
+                )
+                assert "Cannot parse arguments" in str(excinfo.value)
+
+        # The connection is still usable.
+        response = await self.model.send_command("?LSTA")
+        assert response == "LOFF"
+
+        await self.model.disconnect()
+
+    async def test_lost_connection(self) -> None:
+        """Tests the model handles losing the connection to the T2SA."""
+        model = lasertracker.T2SAModel(
+            host=LOCAL_HOST,
+            port=self.mock_t2sa.port,
+            read_timeout=STANDARD_TIMEOUT,
+            t2sa_simulation_mode=1,
+            log=self.log,
+        )
+        await model.connect()
+        assert model.connected
+
+        # The T2SA drops the connection mid-session.
+        await self.mock_t2sa.close_client()
+        with pytest.raises(RuntimeError):
+            await model.send_command("?LSTA")
+        assert not model.connected
+
+        await model.connect()
+        assert model.connected
+        response = await model.send_command("?LSTA")
+        assert response == "LOFF"
+
+        # The connection is reset while writing a command.
+        assert model.writer is not None
+        with unittest.mock.patch.object(
+            model.writer, "drain", side_effect=ConnectionResetError()
+        ):
+            with pytest.raises(RuntimeError, match="Connection lost while sending"):
+                await model.send_command("?LSTA")
+        assert not model.connected
+        assert model.reader is None
+        assert model.writer is None
+
+        async with asyncio.timeout(STANDARD_TIMEOUT):
+            while self.mock_t2sa.connected:
+                await asyncio.sleep(0.1)
+        await model.connect()
+        assert model.connected
+        response = await model.send_command("?LSTA")
+        assert response == "LOFF"
+
+        # The connection is lost while halt waits for another command
+        # (e.g. a measurement) to release the communication lock.
+        async with model.comm_lock:
+            halt_task = asyncio.create_task(model.halt())
+            # Give halt time to write !HALT and start waiting for the lock.
+            await asyncio.sleep(0.1)
+            assert not halt_task.done()
+            await self.mock_t2sa.close_client()
+            # What the other command does when its read fails.
+            await model.handle_lost_connection()
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await asyncio.wait_for(halt_task, timeout=STANDARD_TIMEOUT)
+        assert not model.connected
+
+        # halt on a lost connection fails the same way.
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await model.halt()
+
+        await model.disconnect()
@@ -39,6 +39,19 @@ def test_parse_single_point_measure() -> None:
         assert data.z == z
 
 
+def test_parse_single_point_measure_with_spaces() -> None:
+    single_point_measure_sample = (
+        "Single Point Measurement M1M3_1 result "
+        "1.0, 2.0, 3.0 08/19/2022 14:45:43 True"
+    )
+
+    data = utils.parse_single_point_measurement(single_point_measure_sample)
+
+    assert data.x == 1.0
+    assert data.y == 2.0
+    assert data.z == 3.0
+
+
 def test_parse_single_point_measure_bad_data() -> None:
     single_point_measure_sample = "Bad data"
 
@@ -58,10 +71,10 @@ def test_parse_offsets() -> None:
 
         data = utils.parse_offsets(offset_measure_sample)
         assert data is not None
-        assert data["target"] == "FrameM2_90.00_0.00_0.00_1"
-        assert data["dX"] == x
-        assert data["dY"] == y
-        assert data["dZ"] == z
-        assert data["dRX"] == u
-        assert data["dRY"] == v
-        assert data["dRZ"] == w
+        assert data.target == "FrameM2_90.00_0.00_0.00_1"
+        assert data.dX == x
+        assert data.dY == y
+        assert data.dZ == z
+        assert data.dRX == u
+        assert data.dRY == v
+        assert data.dRZ == w